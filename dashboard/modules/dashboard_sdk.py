@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import importlib
 import logging
 import json
@@ -120,6 +121,16 @@ def get_job_submission_client_cluster_info(
     )
 
 
+@functools.lru_cache(maxsize=128)
+def _resolve_module(module_string: str):
+    """Resolve the module used to get cluster info for a custom address scheme.
+
+    Cached so repeated job submissions to the same scheme skip the
+    importlib machinery.
+    """
+    return importlib.import_module(module_string)
+
+
 def parse_cluster_info(
     address: Optional[str] = None,
     create_cluster_if_needed: bool = False,
@@ -175,7 +186,7 @@ def parse_cluster_info(
     # Try to dynamically import the function to get cluster info.
     else:
         try:
-            module = importlib.import_module(module_string)
+            module = _resolve_module(module_string)
         except Exception:
             raise RuntimeError(
                 f"Module: {module_string} does not exist.\n"
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import logging
 import time
@@ -236,14 +237,20 @@ class NodeHead(dashboard_utils.DashboardHeadModule):
         )
 
     @routes.get("/nodes")
+    @dashboard_optional_utils.if_none_match
     @dashboard_optional_utils.aiohttp_cache
     async def get_all_nodes(self, req) -> aiohttp.web.Response:
         view = req.query.get("view")
         if view == "summary":
             all_node_summary = await DataOrganizer.get_all_node_summary()
-            return dashboard_optional_utils.rest_response(
+            response = dashboard_optional_utils.rest_response(
                 success=True, message="Node summary fetched.", summary=all_node_summary
             )
+            # A weak validator over the payload lets pollers use
+            # If-None-Match and get a bodyless 304 when nothing changed.
+            etag = 'W/"{}"'.format(hashlib.md5(response.body).hexdigest())
+            response.headers["ETag"] = etag
+            return response
         elif view is not None and view.lower() == "hostNameList".lower():
             alive_hostnames = set()
             for node in DataSource.nodes.values():
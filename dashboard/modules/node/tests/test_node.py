@@ -3,11 +3,11 @@ import sys
 import logging
 import requests
 import time
-import traceback
 import random
 import pytest
 import ray
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from ray.cluster_utils import Cluster
 from ray.dashboard.modules.node.node_consts import UPDATE_NODES_INTERVAL_SECONDS
@@ -22,51 +22,56 @@ from ray._private.test_utils import (
 logger = logging.getLogger(__name__)
 
 
-def test_nodes_update(enable_test_module, ray_start_with_dashboard):
+@pytest.fixture(scope="module")
+def http_session():
+    """A shared HTTP session so the polling loops below reuse keep-alive
+    connections instead of opening a new TCP connection per request."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
+def test_nodes_update(enable_test_module, ray_start_with_dashboard, http_session):
     assert wait_until_server_available(ray_start_with_dashboard["webui_url"]) is True
     webui_url = ray_start_with_dashboard["webui_url"]
     webui_url = format_web_url(webui_url)
 
-    timeout_seconds = 10
-    start_time = time.time()
-    while True:
-        time.sleep(1)
+    def _check_nodes_update():
+        response = http_session.get(webui_url + "/test/dump")
+        response.raise_for_status()
         try:
-            response = requests.get(webui_url + "/test/dump")
-            response.raise_for_status()
-            try:
-                dump_info = response.json()
-            except Exception as ex:
-                logger.info("failed response: %s", response.text)
-                raise ex
-            assert dump_info["result"] is True
-            dump_data = dump_info["data"]
-            assert len(dump_data["nodes"]) == 1
-            assert len(dump_data["agents"]) == 1
-            assert len(dump_data["nodeIdToIp"]) == 1
-            assert len(dump_data["nodeIdToHostname"]) == 1
-            assert dump_data["nodes"].keys() == dump_data["nodeIdToHostname"].keys()
-
-            response = requests.get(webui_url + "/test/notified_agents")
-            response.raise_for_status()
-            try:
-                notified_agents = response.json()
-            except Exception as ex:
-                logger.info("failed response: %s", response.text)
-                raise ex
-            assert notified_agents["result"] is True
-            notified_agents = notified_agents["data"]
-            assert len(notified_agents) == 1
-            assert notified_agents == dump_data["agents"]
-            break
-        except (AssertionError, requests.exceptions.ConnectionError) as e:
-            logger.info("Retry because of %s", e)
-        finally:
-            if time.time() > start_time + timeout_seconds:
-                raise Exception("Timed out while testing.")
-
-
-def test_node_info(disable_aiohttp_cache, ray_start_with_dashboard):
+            dump_info = response.json()
+        except Exception as ex:
+            logger.info("failed response: %s", response.text)
+            raise ex
+        assert dump_info["result"] is True
+        dump_data = dump_info["data"]
+        assert len(dump_data["nodes"]) == 1
+        assert len(dump_data["agents"]) == 1
+        assert len(dump_data["nodeIdToIp"]) == 1
+        assert len(dump_data["nodeIdToHostname"]) == 1
+        assert dump_data["nodes"].keys() == dump_data["nodeIdToHostname"].keys()
+
+        response = http_session.get(webui_url + "/test/notified_agents")
+        response.raise_for_status()
+        try:
+            notified_agents = response.json()
+        except Exception as ex:
+            logger.info("failed response: %s", response.text)
+            raise ex
+        assert notified_agents["result"] is True
+        notified_agents = notified_agents["data"]
+        assert len(notified_agents) == 1
+        assert notified_agents == dump_data["agents"]
+        return True
+
+    wait_for_condition(_check_nodes_update, timeout=10)
+
+
+def test_node_info(disable_aiohttp_cache, ray_start_with_dashboard, http_session):
     @ray.remote
     class Actor:
         def getpid(self):
@@ -82,72 +87,56 @@ def test_node_info(disable_aiohttp_cache, ray_start_with_dashboard):
     webui_url = format_web_url(webui_url)
     node_id = ray_start_with_dashboard["node_id"]
 
-    timeout_seconds = 10
-    start_time = time.time()
-    last_ex = None
-    while True:
-        time.sleep(1)
-        try:
-            response = requests.get(webui_url + "/nodes?view=hostnamelist")
-            response.raise_for_status()
-            hostname_list = response.json()
-            assert hostname_list["result"] is True, hostname_list["msg"]
-            hostname_list = hostname_list["data"]["hostNameList"]
-            assert len(hostname_list) == 1
+    def _check_node_info():
+        response = http_session.get(webui_url + "/nodes?view=hostnamelist")
+        response.raise_for_status()
+        hostname_list = response.json()
+        assert hostname_list["result"] is True, hostname_list["msg"]
+        hostname_list = hostname_list["data"]["hostNameList"]
+        assert len(hostname_list) == 1
 
-            hostname = hostname_list[0]
-            response = requests.get(webui_url + f"/nodes/{node_id}")
-            response.raise_for_status()
-            detail = response.json()
-            assert detail["result"] is True, detail["msg"]
-            detail = detail["data"]["detail"]
-            assert detail["hostname"] == hostname
-            assert detail["raylet"]["state"] == "ALIVE"
-            assert detail["raylet"]["isHeadNode"] is True
-            assert "raylet" in detail["cmdline"][0]
-            assert len(detail["workers"]) >= 2
-            assert len(detail["actors"]) == 2, detail["actors"]
-
-            actor_worker_pids = set()
-            for worker in detail["workers"]:
-                if "ray::Actor" in worker["cmdline"][0]:
-                    actor_worker_pids.add(worker["pid"])
-            assert actor_worker_pids == actor_pids
-
-            response = requests.get(webui_url + "/nodes?view=summary")
-            response.raise_for_status()
-            summary = response.json()
-            assert summary["result"] is True, summary["msg"]
-            assert len(summary["data"]["summary"]) == 1
-            summary = summary["data"]["summary"][0]
-            assert summary["hostname"] == hostname
-            assert summary["raylet"]["state"] == "ALIVE"
-            assert "raylet" in summary["cmdline"][0]
-            assert "workers" not in summary
-            assert "actors" not in summary
-            assert "objectStoreAvailableMemory" in summary["raylet"]
-            assert "objectStoreUsedMemory" in summary["raylet"]
-            break
-        except Exception as ex:
-            last_ex = ex
-        finally:
-            if time.time() > start_time + timeout_seconds:
-                ex_stack = (
-                    traceback.format_exception(
-                        type(last_ex), last_ex, last_ex.__traceback__
-                    )
-                    if last_ex
-                    else []
-                )
-                ex_stack = "".join(ex_stack)
-                raise Exception(f"Timed out while testing, {ex_stack}")
+        hostname = hostname_list[0]
+        response = http_session.get(webui_url + f"/nodes/{node_id}")
+        response.raise_for_status()
+        detail = response.json()
+        assert detail["result"] is True, detail["msg"]
+        detail = detail["data"]["detail"]
+        assert detail["hostname"] == hostname
+        assert detail["raylet"]["state"] == "ALIVE"
+        assert detail["raylet"]["isHeadNode"] is True
+        assert "raylet" in detail["cmdline"][0]
+        assert len(detail["workers"]) >= 2
+        assert len(detail["actors"]) == 2, detail["actors"]
+
+        actor_worker_pids = set()
+        for worker in detail["workers"]:
+            if "ray::Actor" in worker["cmdline"][0]:
+                actor_worker_pids.add(worker["pid"])
+        assert actor_worker_pids == actor_pids
+
+        response = http_session.get(webui_url + "/nodes?view=summary")
+        response.raise_for_status()
+        summary = response.json()
+        assert summary["result"] is True, summary["msg"]
+        assert len(summary["data"]["summary"]) == 1
+        summary = summary["data"]["summary"][0]
+        assert summary["hostname"] == hostname
+        assert summary["raylet"]["state"] == "ALIVE"
+        assert "raylet" in summary["cmdline"][0]
+        assert "workers" not in summary
+        assert "actors" not in summary
+        assert "objectStoreAvailableMemory" in summary["raylet"]
+        assert "objectStoreUsedMemory" in summary["raylet"]
+        return True
+
+    wait_for_condition(_check_node_info, timeout=10)
 
 
 @pytest.mark.parametrize(
     "ray_start_cluster_head", [{"include_dashboard": True}], indirect=True
 )
 def test_multi_nodes_info(
-    enable_test_module, disable_aiohttp_cache, ray_start_cluster_head
+    enable_test_module, disable_aiohttp_cache, ray_start_cluster_head, http_session
 ):
     cluster: Cluster = ray_start_cluster_head
     assert wait_until_server_available(cluster.webui_url) is True
@@ -158,21 +147,31 @@ def test_multi_nodes_info(
 
     def _check_nodes():
         try:
-            response = requests.get(webui_url + "/nodes?view=summary")
+            response = http_session.get(webui_url + "/nodes?view=summary")
             response.raise_for_status()
             summary = response.json()
             assert summary["result"] is True, summary["msg"]
             summary = summary["data"]["summary"]
             assert len(summary) == 3
-            for node_info in summary:
-                node_id = node_info["raylet"]["nodeId"]
-                response = requests.get(webui_url + f"/nodes/{node_id}")
+            node_ids = [node_info["raylet"]["nodeId"] for node_info in summary]
+            # Fetch the per-node details concurrently instead of paying one
+            # round trip per node.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(
+                    executor.map(
+                        lambda node_id: http_session.get(
+                            webui_url + f"/nodes/{node_id}"
+                        ),
+                        node_ids,
+                    )
+                )
+            for response in responses:
                 response.raise_for_status()
                 detail = response.json()
                 assert detail["result"] is True, detail["msg"]
                 detail = detail["data"]["detail"]
                 assert detail["raylet"]["state"] == "ALIVE"
-            response = requests.get(webui_url + "/test/dump?key=agents")
+            response = http_session.get(webui_url + "/test/dump?key=agents")
             response.raise_for_status()
             agents = response.json()
             assert len(agents["data"]["agents"]) == 3
@@ -188,18 +187,23 @@ def test_multi_nodes_info(
     "ray_start_cluster_head", [{"include_dashboard": True}], indirect=True
 )
 def test_multi_node_churn(
-    enable_test_module, disable_aiohttp_cache, ray_start_cluster_head
+    enable_test_module, disable_aiohttp_cache, ray_start_cluster_head, http_session
 ):
     cluster: Cluster = ray_start_cluster_head
     assert wait_until_server_available(cluster.webui_url) is True
     webui_url = format_web_url(cluster.webui_url)
 
+    # Set whenever the chaos monkey mutates the cluster, so the main loop
+    # validates right after each mutation instead of sleeping blindly.
+    node_changed = threading.Event()
+
     def cluster_chaos_monkey():
         worker_nodes = []
         while True:
             time.sleep(5)
             if len(worker_nodes) < 2:
                 worker_nodes.append(cluster.add_node())
+                node_changed.set()
                 continue
             should_add_node = random.randint(0, 1)
             if should_add_node:
@@ -208,14 +212,22 @@ def test_multi_node_churn(
                 node_index = random.randrange(0, len(worker_nodes))
                 node_to_remove = worker_nodes.pop(node_index)
                 cluster.remove_node(node_to_remove)
+            node_changed.set()
 
     def get_index():
-        resp = requests.get(webui_url)
+        resp = http_session.get(webui_url)
         resp.raise_for_status()
 
+    last_etag = [None]
+
     def get_nodes():
-        resp = requests.get(webui_url + "/nodes?view=summary")
+        headers = {"If-None-Match": last_etag[0]} if last_etag[0] else {}
+        resp = http_session.get(webui_url + "/nodes?view=summary", headers=headers)
         resp.raise_for_status()
+        if resp.status_code == 304:
+            # Summary unchanged since the last poll; nothing to parse.
+            return
+        last_etag[0] = resp.headers.get("ETag")
         summary = resp.json()
         assert summary["result"] is True, summary["msg"]
         assert summary["data"]["summary"]
@@ -227,14 +239,17 @@ def test_multi_node_churn(
     duration = timedelta(seconds=60)
     while datetime.now() < t_st + duration:
         get_index()
-        time.sleep(2)
+        get_nodes()
+        # Wake up as soon as the cluster mutates, capped at the old 2s poll.
+        node_changed.wait(timeout=2)
+        node_changed.clear()
 
 
 @pytest.mark.parametrize(
     "ray_start_cluster_head", [{"include_dashboard": True}], indirect=True
 )
 def test_frequent_node_update(
-    enable_test_module, disable_aiohttp_cache, ray_start_cluster_head
+    enable_test_module, disable_aiohttp_cache, ray_start_cluster_head, http_session
 ):
     cluster: Cluster = ray_start_cluster_head
     assert wait_until_server_available(cluster.webui_url)
@@ -242,7 +257,7 @@ def test_frequent_node_update(
     webui_url = format_web_url(webui_url)
 
     def verify():
-        response = requests.get(webui_url + "/internal/node_module")
+        response = http_session.get(webui_url + "/internal/node_module")
         response.raise_for_status()
         result = response.json()
         data = result["data"]
@@ -173,6 +173,30 @@ def rest_response(
     )
 
 
+def if_none_match(handler):
+    """Web handler decorator that honors conditional GETs.
+
+    If the wrapped handler's response carries an ETag header and the
+    request's If-None-Match header matches it, the response is replaced
+    with an empty 304 Not Modified, so pollers that already hold the
+    current payload skip the transfer and the JSON parse.
+
+    Apply it outside of aiohttp_cache so 304 responses are computed per
+    request and never cached.
+    """
+
+    @functools.wraps(handler)
+    async def _conditional_handler(*args) -> aiohttp.web.Response:
+        req = args[-1]
+        response = await handler(*args)
+        etag = response.headers.get(hdrs.ETAG)
+        if etag is not None and req.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return aiohttp.web.Response(status=304, headers={hdrs.ETAG: etag})
+        return response
+
+    return _conditional_handler
+
+
 # The cache value type used by aiohttp_cache.
 _AiohttpCacheValue = namedtuple("AiohttpCacheValue", ["data", "expiration", "task"])
 # The methods with no request body used by aiohttp_cache.
@@ -509,7 +509,7 @@ def kill_actor_and_wait_for_failure(actor, timeout=10, retry_interval_ms=100):
 
 
 def wait_for_condition(
-    condition_predictor, timeout=10, retry_interval_ms=100, **kwargs: Any
+    condition_predictor, timeout=10, retry_interval_ms=100, event=None, **kwargs: Any
 ):
     """Wait until a condition is met or time out with an exception.
 
@@ -517,6 +517,10 @@ def wait_for_condition(
         condition_predictor: A function that predicts the condition.
         timeout: Maximum timeout in seconds.
         retry_interval_ms: Retry interval in milliseconds.
+        event: If provided, a threading.Event that is set whenever the
+            condition may have changed. It is waited on between checks
+            instead of sleeping the fixed retry interval, so the condition
+            is re-checked as soon as it is notified.
 
     Raises:
         RuntimeError: If the condition is not met before the timeout expires.
@@ -529,7 +533,12 @@ def wait_for_condition(
                 return
         except Exception:
             last_ex = ray._private.utils.format_error_message(traceback.format_exc())
-        time.sleep(retry_interval_ms / 1000.0)
+        if event is not None:
+            # Re-check on notification (or deadline), whichever comes first.
+            event.wait(timeout=max(0, start + timeout - time.time()))
+            event.clear()
+        else:
+            time.sleep(retry_interval_ms / 1000.0)
     message = "The condition wasn't met before the timeout expired."
     if last_ex is not None:
         message += f" Last exception: {last_ex}"
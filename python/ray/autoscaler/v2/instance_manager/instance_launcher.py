@@ -0,0 +1,177 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from ray.autoscaler._private.constants import (
+    AUTOSCALER_MAX_CONCURRENT_LAUNCHES,
+    AUTOSCALER_MAX_LAUNCH_BATCH,
+)
+from ray.autoscaler.v2.instance_manager.instance_storage import (
+    InstanceStorage,
+    InstanceUpdatedSuscriber,
+    InstanceUpdateEvent,
+)
+from ray.autoscaler.v2.instance_manager.node_provider import NodeProvider
+from ray.core.generated.instance_manager_pb2 import Instance
+
+logger = logging.getLogger(__name__)
+
+
+class InstanceLauncher(InstanceUpdatedSuscriber):
+    """InstanceLauncher is responsible for provisioning new instances from
+    the cloud provider.
+
+    It subscribes to instance status changes and launches cloud instances
+    for instances that are newly added to the storage.
+    """
+
+    def __init__(
+        self,
+        instance_storage: InstanceStorage,
+        node_provider: NodeProvider,
+        # Branchless integer ceiling division; both constants are ints.
+        max_concurrent_requests: int = -(
+            -AUTOSCALER_MAX_CONCURRENT_LAUNCHES // AUTOSCALER_MAX_LAUNCH_BATCH
+        ),
+        max_instances_per_request: int = AUTOSCALER_MAX_LAUNCH_BATCH,
+    ) -> None:
+        self._instance_storage = instance_storage
+        self._node_provider = node_provider
+        self._max_concurrent_requests = max_concurrent_requests
+        self._max_instances_per_request = max_instances_per_request
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._launch_instance_executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrent_requests
+        )
+
+    def notify(self, events: List[InstanceUpdateEvent]) -> None:
+        # TODO: we should do reconciliation based on events.
+        has_new_request = any(
+            event.new_status == Instance.INSTANCE_STATUS_UNSPECIFIED
+            for event in events
+        )
+        if has_new_request:
+            self._executor.submit(self._may_launch_new_instances)
+
+    def _may_launch_new_instances(self) -> None:
+        new_instances, _ = self._instance_storage.get_instances(
+            status_filter={Instance.INSTANCE_STATUS_UNSPECIFIED}
+        )
+
+        if not new_instances:
+            logger.debug("No instances to launch")
+            return
+
+        # New instances are submitted to the launch executor right away, so
+        # the intermediate QUEUED write is skipped: each launch batch does a
+        # single fused transition to REQUESTED guarded by the instance
+        # versions read here. The CAS happening before create_nodes also
+        # guarantees a concurrent reconciliation pass cannot double-launch
+        # the same instances.
+        instances_by_type = defaultdict(list)
+        for instance in new_instances.values():
+            instances_by_type[instance.instance_type].append(instance)
+
+        launch_batches = [
+            # Slicing already clamps to the end of the list.
+            (instance_type, instances[i : i + self._max_instances_per_request])
+            for instance_type, instances in instances_by_type.items()
+            for i in range(0, len(instances), self._max_instances_per_request)
+        ]
+
+        # Hand all batches to the executor in one go.
+        self._launch_instance_executor.map(
+            lambda batch: self._launch_new_instances_by_type(*batch),
+            launch_batches,
+        )
+
+    def _launch_new_instances_by_type(
+        self, instance_type: str, instances: List[Instance]
+    ) -> int:
+        """Launches instances of the given type.
+
+        Args:
+            instance_type: The type of the instances to launch.
+            instances: The instances to launch.
+
+        Returns:
+            The number of instances successfully launched.
+        """
+        logger.info(f"Launching {len(instances)} instances of type {instance_type}")
+        expected_versions = {
+            instance.instance_id: instance.version for instance in instances
+        }
+        for instance in instances:
+            instance.status = Instance.REQUESTED
+
+        # Transition the whole batch to REQUESTED with one batched write.
+        success, version = self._instance_storage.batch_upsert_instances(
+            instances,
+            expected_instance_versions=expected_versions,
+        )
+        if not success:
+            logger.warning(
+                f"Failed to request {len(instances)} instances of type "
+                f"{instance_type}: instance versions changed"
+            )
+            return 0
+
+        instances_selected = []
+        for instance in instances:
+            instance.version = version
+            instances_selected.append(instance)
+
+        created_cloud_instances = self._node_provider.create_nodes(
+            instance_type, len(instances_selected)
+        )
+
+        assert len(created_cloud_instances) <= len(instances_selected)
+
+        instances_allocated = []
+        while created_cloud_instances and instances_selected:
+            cloud_instance = created_cloud_instances.pop()
+            instance = instances_selected.pop()
+            instance.cloud_instance_id = cloud_instance.cloud_instance_id
+            instance.internal_ip = cloud_instance.internal_ip
+            instance.external_ip = cloud_instance.external_ip
+            instance.status = Instance.INSTANCE_ALLOCATED
+            instances_allocated.append(instance)
+
+        instances_launched = 0
+        if instances_allocated:
+            # Record all successful allocations with one batched write.
+            success, _ = self._instance_storage.batch_upsert_instances(
+                instances_allocated,
+                expected_instance_versions={
+                    instance.instance_id: instance.version
+                    for instance in instances_allocated
+                },
+            )
+            if success:
+                instances_launched = len(instances_allocated)
+            else:
+                # TODO: this could only happen when the request is canceled.
+                logger.warning(
+                    f"Failed to record {len(instances_allocated)} allocated "
+                    f"instances of type {instance_type}"
+                )
+                # the cloud instances are leaked, we need to terminate them
+                for instance in instances_allocated:
+                    self._node_provider.terminate_node(instance.cloud_instance_id)
+
+        if instances_selected:
+            # instance creation failed, we need to mark the instances
+            # as ALLOCATION_FAILED.
+            for instance in instances_selected:
+                instance.status = Instance.ALLOCATION_FAILED
+            # TODO: a failure could only happen when the request is canceled.
+            self._instance_storage.batch_upsert_instances(
+                instances_selected,
+                expected_instance_versions={
+                    instance.instance_id: instance.version
+                    for instance in instances_selected
+                },
+            )
+
+        return instances_launched
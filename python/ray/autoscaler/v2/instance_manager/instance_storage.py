@@ -45,11 +45,15 @@ class InstanceStorage:
         self,
         updates: List[Instance],
         expected_storage_version: Optional[int] = None,
+        expected_instance_versions: Optional[Dict[str, int]] = None,
     ) -> StoreStatus:
         """Upsert instances into the storage. If the instance already exists,
         it will be updated. Otherwise, it will be inserted. If the
         expected_storage_version is specified, the update will fail if the
         current storage version does not match the expected version.
+        Similarly, if expected_instance_versions is specified, the whole
+        update will fail if any of the instances does not match its
+        expected version.
 
         Note the version of the upserted instances will be set to the current
         storage version.
@@ -57,6 +61,8 @@ class InstanceStorage:
         Args:
             updates: A list of instances to be upserted.
             expected_storage_version: The expected storage version.
+            expected_instance_versions: A dictionary of
+                (instance_id, expected instance version) pairs.
 
         Returns:
             StoreStatus: A tuple of (success, storage_version).
@@ -74,7 +80,11 @@ class InstanceStorage:
             mutations[instance.instance_id] = instance.SerializeToString()
 
         result, version = self._storage.batch_update(
-            self._table_name, mutations, {}, expected_storage_version
+            self._table_name,
+            mutations,
+            {},
+            expected_storage_version,
+            expected_instance_versions,
         )
 
         if result and self._status_change_subscriber:
@@ -28,6 +28,7 @@ class Storage(metaclass=ABCMeta):
         mutation: Optional[Dict[str, str]] = None,
         deletion: Optional[List[str]] = None,
         expected_storage_version: Optional[int] = None,
+        expected_entry_versions: Optional[Dict[str, int]] = None,
     ) -> StoreStatus:
         """Batch update the storage table. This method is atomic.
 
@@ -38,6 +39,9 @@ class Storage(metaclass=ABCMeta):
             expected_storage_version: The expected storage version. The
                 update will fail if the version does not match the
                 current storage version.
+            expected_entry_versions: A dictionary of (key, expected entry
+                version) pairs. The whole update will fail if any of the
+                entries does not match its expected version.
 
         Returns:
             StoreStatus: A tuple of (success, version). If the update is
@@ -122,12 +126,18 @@ class InMemoryStorage(Storage):
         mutation: Dict[str, str] = None,
         deletion: List[str] = None,
         expected_version: Optional[int] = None,
+        expected_entry_versions: Optional[Dict[str, int]] = None,
     ) -> StoreStatus:
         mutation = mutation if mutation else {}
         deletion = deletion if deletion else []
         with self._lock:
             if expected_version is not None and expected_version != self._version:
                 return StoreStatus(False, self._version)
+            if expected_entry_versions:
+                for key, expected_entry_version in expected_entry_versions.items():
+                    _, version = self._tables[table].get(key, (None, -1))
+                    if expected_entry_version != version:
+                        return StoreStatus(False, self._version)
             self._version += 1
             key_value_pairs_with_version = {
                 key: VersionedValue(value, self._version)
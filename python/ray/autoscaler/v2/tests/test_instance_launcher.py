@@ -0,0 +1,187 @@
+# coding: utf-8
+import os
+import sys
+import threading
+from typing import Dict, List
+
+import pytest  # noqa
+
+from ray.autoscaler.v2.instance_manager.instance_launcher import InstanceLauncher
+from ray.autoscaler.v2.instance_manager.instance_storage import InstanceStorage
+from ray.autoscaler.v2.instance_manager.node_provider import NodeProvider
+from ray.autoscaler.v2.instance_manager.storage import InMemoryStorage
+from ray.core.generated.instance_manager_pb2 import Instance
+
+
+class FakeNodeProvider(NodeProvider):
+    """A node provider that launches fake cloud instances in memory."""
+
+    def __init__(self, fail_creation: bool = False):
+        self._next_cloud_instance_id = 0
+        self._fail_creation = fail_creation
+        self.terminated_cloud_instance_ids = []
+
+    def create_nodes(self, instance_type_name: str, count: int) -> List[Instance]:
+        if self._fail_creation:
+            return []
+        created = []
+        for _ in range(count):
+            instance = Instance()
+            instance.cloud_instance_id = f"cloud-{self._next_cloud_instance_id}"
+            instance.internal_ip = f"10.0.0.{self._next_cloud_instance_id}"
+            instance.external_ip = f"1.2.3.{self._next_cloud_instance_id}"
+            instance.instance_type = instance_type_name
+            self._next_cloud_instance_id += 1
+            created.append(instance)
+        return created
+
+    def terminate_node(self, cloud_instance_id: str) -> None:
+        self.terminated_cloud_instance_ids.append(cloud_instance_id)
+
+    def get_non_terminated_nodes(self) -> Dict[str, Instance]:
+        return {}
+
+    def get_nodes_by_cloud_instance_id(
+        self, cloud_instance_ids: List[str]
+    ) -> Dict[str, Instance]:
+        return {}
+
+    def is_readonly(self) -> bool:
+        return False
+
+
+def create_instance_storage() -> InstanceStorage:
+    return InstanceStorage(
+        cluster_id="test_cluster",
+        storage=InMemoryStorage(),
+    )
+
+
+def add_new_instances(
+    instance_storage: InstanceStorage, instance_ids: List[str], instance_type: str
+) -> None:
+    assert instance_storage.batch_upsert_instances(
+        [
+            Instance(
+                instance_id=instance_id,
+                instance_type=instance_type,
+                status=Instance.INSTANCE_STATUS_UNSPECIFIED,
+            )
+            for instance_id in instance_ids
+        ]
+    ).success
+
+
+def test_launch_new_instances():
+    instance_storage = create_instance_storage()
+    node_provider = FakeNodeProvider()
+    launcher = InstanceLauncher(
+        instance_storage=instance_storage,
+        node_provider=node_provider,
+    )
+    add_new_instances(instance_storage, ["instance1", "instance2"], "worker_type")
+
+    launcher._may_launch_new_instances()
+    launcher._launch_instance_executor.shutdown(wait=True)
+
+    instances, _ = instance_storage.get_instances()
+    assert len(instances) == 2
+    for instance in instances.values():
+        assert instance.status == Instance.INSTANCE_ALLOCATED
+        assert instance.cloud_instance_id
+        assert instance.internal_ip
+    assert node_provider.terminated_cloud_instance_ids == []
+
+
+def test_launch_no_new_instances():
+    instance_storage = create_instance_storage()
+    node_provider = FakeNodeProvider()
+    launcher = InstanceLauncher(
+        instance_storage=instance_storage,
+        node_provider=node_provider,
+    )
+
+    # No instances in the storage, nothing should be launched.
+    launcher._may_launch_new_instances()
+    launcher._launch_instance_executor.shutdown(wait=True)
+
+    instances, _ = instance_storage.get_instances()
+    assert instances == {}
+
+
+def test_launch_allocation_failure():
+    instance_storage = create_instance_storage()
+    node_provider = FakeNodeProvider(fail_creation=True)
+    launcher = InstanceLauncher(
+        instance_storage=instance_storage,
+        node_provider=node_provider,
+    )
+    add_new_instances(instance_storage, ["instance1"], "worker_type")
+
+    launcher._may_launch_new_instances()
+    launcher._launch_instance_executor.shutdown(wait=True)
+
+    instances, _ = instance_storage.get_instances()
+    assert len(instances) == 1
+    assert instances["instance1"].status == Instance.ALLOCATION_FAILED
+
+
+def test_launch_batches_by_type():
+    instance_storage = create_instance_storage()
+    node_provider = FakeNodeProvider()
+    launcher = InstanceLauncher(
+        instance_storage=instance_storage,
+        node_provider=node_provider,
+        max_instances_per_request=2,
+    )
+    add_new_instances(
+        instance_storage, ["instance1", "instance2", "instance3"], "worker_type"
+    )
+    add_new_instances(instance_storage, ["instance4"], "other_type")
+
+    launcher._may_launch_new_instances()
+    launcher._launch_instance_executor.shutdown(wait=True)
+
+    instances, _ = instance_storage.get_instances()
+    assert len(instances) == 4
+    for instance in instances.values():
+        assert instance.status == Instance.INSTANCE_ALLOCATED
+
+
+def test_launch_batches_run_concurrently():
+    class BarrierNodeProvider(FakeNodeProvider):
+        """Blocks create_nodes until all expected calls are in flight, so the
+        test deadlocks (and the barrier breaks) if batches run serially."""
+
+        def __init__(self, parties: int):
+            super().__init__()
+            self._barrier = threading.Barrier(parties, timeout=30)
+
+        def create_nodes(self, instance_type_name: str, count: int) -> List[Instance]:
+            self._barrier.wait()
+            return super().create_nodes(instance_type_name, count)
+
+    instance_storage = create_instance_storage()
+    node_provider = BarrierNodeProvider(parties=2)
+    launcher = InstanceLauncher(
+        instance_storage=instance_storage,
+        node_provider=node_provider,
+        max_concurrent_requests=2,
+    )
+    add_new_instances(instance_storage, ["instance1"], "worker_type")
+    add_new_instances(instance_storage, ["instance2"], "other_type")
+
+    launcher._may_launch_new_instances()
+    launcher._launch_instance_executor.shutdown(wait=True)
+
+    instances, _ = instance_storage.get_instances()
+    assert len(instances) == 2
+    for instance in instances.values():
+        assert instance.status == Instance.INSTANCE_ALLOCATED
+
+
+if __name__ == "__main__":
+    if os.environ.get("PARALLEL_CI"):
+        sys.exit(pytest.main(["-n", "auto", "--boxed", "-vs", __file__]))
+    else:
+        sys.exit(pytest.main(["-sv", __file__]))
@@ -482,25 +482,25 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 yield None, self.to_block()
                 return
 
-            start = end = 0
-            iter = self.iter_rows(public_row_format=False)
-            next_row = None
-            while True:
-                try:
-                    if next_row is None:
-                        next_row = next(iter)
-                    next_key = next_row[key]
-                    while next_row[key] == next_key:
-                        end += 1
-                        try:
-                            next_row = next(iter)
-                        except StopIteration:
-                            next_row = None
-                            break
-                    yield next_key, self.slice(start, end)
-                    start = end
-                except StopIteration:
-                    break
+            # The block is sorted by key, so each group is a contiguous run of
+            # equal keys; find the run boundaries with a single vectorized
+            # comparison instead of iterating over the rows in Python.
+            col = self._table[key]
+            if len(col) == 0:
+                return
+            if col.null_count > 0:
+                # Nulls convert to NaN under to_numpy(), which breaks equality,
+                # so fall back to an object array holding Python values.
+                keys = np.asarray(col.to_pylist(), dtype=object)
+            else:
+                # ChunkedArray.to_numpy() only accepts zero_copy_only on
+                # pyarrow >= 13, so flatten to a single Array first.
+                keys = col.combine_chunks().to_numpy(zero_copy_only=False)
+            boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+            start = 0
+            for end in boundaries.tolist() + [len(keys)]:
+                yield keys[start], self.slice(start, end)
+                start = end
 
         builder = ArrowBlockBuilder()
         for group_key, group_view in iter_groups():
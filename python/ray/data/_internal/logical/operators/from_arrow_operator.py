@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import ray
 from ray.data._internal.logical.interfaces import LogicalOperator
@@ -21,12 +21,23 @@ class FromArrowRefs(LogicalOperator):
         op_name: str = "FromArrowRefs",
     ):
         super().__init__(op_name, [])
-        self._tables: List[ObjectRef[ArrowTable]] = []
-        for table_or_ref in tables:
-            if isinstance(table_or_ref, ray.ObjectRef):
-                self._tables.append(table_or_ref)
-            else:
-                self._tables.append(ray.put(table_or_ref))
+        self._input_tables = tables
+        self._table_refs: Optional[List[ObjectRef[ArrowTable]]] = None
+
+    @property
+    def _tables(self) -> List[ObjectRef[ArrowTable]]:
+        # Tables passed by value are put into the object store lazily, so that
+        # merely constructing this operator (e.g. to link a logical plan onto
+        # an already-materialized dataset, as `from_huggingface` does) does not
+        # serialize tables whose blocks are never read through it.
+        if self._table_refs is None:
+            self._table_refs = [
+                table_or_ref
+                if isinstance(table_or_ref, ray.ObjectRef)
+                else ray.put(table_or_ref)
+                for table_or_ref in self._input_tables
+            ]
+        return self._table_refs
 
 
 class FromHuggingFace(FromArrowRefs):
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import ray
 from ray.data._internal.logical.interfaces import LogicalOperator
@@ -18,12 +18,23 @@ class FromNumpyRefs(LogicalOperator):
         op_name: str = "FromNumpyRefs",
     ):
         super().__init__(op_name, [])
-        self._ndarrays: List[ObjectRef["np.ndarray"]] = []
-        for arr_or_ref in ndarrays:
-            if isinstance(arr_or_ref, ray.ObjectRef):
-                self._ndarrays.append(arr_or_ref)
-            else:
-                self._ndarrays.append(ray.put(arr_or_ref))
+        self._input_ndarrays = ndarrays
+        self._ndarray_refs: Optional[List[ObjectRef["np.ndarray"]]] = None
+
+    @property
+    def _ndarrays(self) -> List[ObjectRef["np.ndarray"]]:
+        # Arrays passed by value are put into the object store lazily, so that
+        # constructing the operator (e.g. FromTF, whose data is ingested
+        # through from_items) does not serialize arrays whose blocks are never
+        # read through it.
+        if self._ndarray_refs is None:
+            self._ndarray_refs = [
+                arr_or_ref
+                if isinstance(arr_or_ref, ray.ObjectRef)
+                else ray.put(arr_or_ref)
+                for arr_or_ref in self._input_ndarrays
+            ]
+        return self._ndarray_refs
 
 
 class FromTF(FromNumpyRefs):
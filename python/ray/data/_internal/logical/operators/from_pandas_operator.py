@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import ray
 from ray.data._internal.logical.interfaces import LogicalOperator
@@ -20,12 +20,22 @@ class FromPandasRefs(LogicalOperator):
         op_name: str = "FromPandasRefs",
     ):
         super().__init__(op_name, [])
-        self._dfs: List[ObjectRef["pandas.DataFrame"]] = []
-        for df_ref in dfs:
-            if isinstance(df_ref, ray.ObjectRef):
-                self._dfs.append(df_ref)
-            else:
-                self._dfs.append(ray.put(df_ref))
+        self._input_dfs = dfs
+        self._df_refs: Optional[List[ObjectRef["pandas.DataFrame"]]] = None
+
+    @property
+    def _dfs(self) -> List[ObjectRef["pandas.DataFrame"]]:
+        # Dataframes passed by value are put into the object store lazily, so
+        # that constructing the operator does not serialize dataframes whose
+        # blocks are never read through it.
+        if self._df_refs is None:
+            self._df_refs = [
+                df_or_ref
+                if isinstance(df_or_ref, ray.ObjectRef)
+                else ray.put(df_or_ref)
+                for df_or_ref in self._input_dfs
+            ]
+        return self._df_refs
 
 
 class FromDask(LogicalOperator):
@@ -1,3 +1,4 @@
+import functools
 import inspect
 from typing import Any, Dict, Iterable, Optional, Union
 
@@ -35,6 +36,18 @@ class AbstractMap(AbstractOneToOne):
 
 
 def _get_udf_name(fn: UserDefinedFunction) -> str:
+    try:
+        return _get_udf_name_cached(fn)
+    except TypeError:
+        # Unhashable UDFs (e.g. callable class instances defining __eq__)
+        # cannot be used as a cache key; derive their name directly.
+        return _get_udf_name_cached.__wrapped__(fn)
+
+
+# The same UDF is often passed to many operators in a pipeline, so cache the
+# name derivation instead of re-running the `inspect` checks on each call.
+@functools.lru_cache(maxsize=512)
+def _get_udf_name_cached(fn: UserDefinedFunction) -> str:
     try:
         if inspect.isclass(fn):
             # callable class
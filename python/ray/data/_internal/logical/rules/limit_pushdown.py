@@ -1,6 +1,6 @@
 import copy
 from collections import deque
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
 from ray.data._internal.logical.operators.one_to_one_operator import (
@@ -8,6 +8,7 @@ from ray.data._internal.logical.operators.one_to_one_operator import (
     Limit,
 )
 from ray.data._internal.logical.operators.read_operator import Read
+from ray.data.datasource.datasource import ReadTask
 
 
 class LimitPushdownRule(Rule):
@@ -20,11 +21,21 @@ class LimitPushdownRule(Rule):
 
     In addition, we also fuse consecutive Limit operators into a single
     Limit operator, i.e. `Limit[n] -> Limit[m]` becomes `Limit[min(n, m)]`.
+
+    Finally, for a Limit operator directly downstream of a Read, we truncate
+    the read tasks of the Read operator to the minimal prefix whose reported
+    row counts cover the limit, so read tasks whose entire output would be
+    dropped are never launched.
     """
 
     def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        # Most plans contain no Limit operator; skip the rewrite traversals
+        # (and the operator copies they make) for those.
+        if not any(isinstance(op, Limit) for op in plan.dag.post_order_iter()):
+            return plan
         optimized_dag = self._apply_limit_pushdown(plan.dag)
         optimized_dag = self._apply_limit_fusion(optimized_dag)
+        optimized_dag = self._apply_limit_into_read_truncation(optimized_dag)
         return LogicalPlan(dag=optimized_dag)
 
     def _apply_limit_pushdown(self, op: LogicalOperator) -> LogicalOperator:
@@ -131,3 +142,49 @@ class LimitPushdownRule(Rule):
                         current_output._input_dependencies = [fused_limit_op]
                     nodes.append(fused_limit_op)
         return current_op
+
+    def _apply_limit_into_read_truncation(self, op: LogicalOperator) -> LogicalOperator:
+        """Given a DAG of LogicalOperators, truncate the read tasks of every
+        Read operator directly upstream of a Limit operator to the minimal
+        prefix of tasks that can produce `limit` rows.
+
+        The Limit operator is kept to trim the final block; this only avoids
+        launching read tasks whose entire output would be dropped."""
+        for current_op in list(op.post_order_iter()):
+            if not isinstance(current_op, Limit):
+                continue
+            upstream_op = current_op.input_dependency
+            if not isinstance(upstream_op, Read):
+                continue
+            truncated_tasks = self._truncate_read_tasks(
+                upstream_op._read_tasks, current_op._limit
+            )
+            if truncated_tasks is None:
+                continue
+            # Replace with a truncated copy instead of mutating in place, since
+            # the original Read operator is shared with the unoptimized plan.
+            read_op_copy = copy.copy(upstream_op)
+            read_op_copy._read_tasks = truncated_tasks
+            read_op_copy._output_dependencies = [current_op]
+            current_op._input_dependencies = [read_op_copy]
+        return op
+
+    @staticmethod
+    def _truncate_read_tasks(
+        read_tasks: List[ReadTask], limit: int
+    ) -> Optional[List[ReadTask]]:
+        """Return the shortest prefix of `read_tasks` whose row counts cover
+        `limit` rows, or None if row counts are unknown or no task could be
+        dropped."""
+        num_rows = 0
+        for idx, read_task in enumerate(read_tasks):
+            task_num_rows = read_task.get_metadata().num_rows
+            if task_num_rows is None:
+                return None
+            num_rows += task_num_rows
+            if num_rows >= limit:
+                if idx + 1 == len(read_tasks):
+                    # All tasks are needed; nothing to truncate.
+                    return None
+                return read_tasks[: idx + 1]
+        return None
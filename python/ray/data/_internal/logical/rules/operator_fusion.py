@@ -349,6 +349,12 @@ class OperatorFusionRule(Rule):
 
 def _are_remote_args_compatible(prev_args, next_args):
     """Check if Ray remote arguments are compatible for merging."""
+    if prev_args == next_args:
+        # Equal args canonicalize to the same dict, and overlaying the
+        # inheritable args of one onto an equal dict is a no-op, so this is
+        # always compatible. This skips the dict copies and walks below for
+        # the common case of identical (often empty) remote args.
+        return True
     prev_args = _canonicalize(prev_args)
     next_args = _canonicalize(next_args)
     remote_args = next_args.copy()
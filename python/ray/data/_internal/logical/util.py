@@ -1,6 +1,7 @@
 import json
 import re
 import threading
+from collections import Counter
 from typing import Dict
 
 from ray._private.usage.usage_lib import TagKey, record_extra_usage_tag
@@ -9,8 +10,10 @@ from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 
-# The dictionary for the operator name and count.
-_recorded_operators = dict()
+# The counter for the operator name and count, guarded by the lock below.
+# `Counter.update` on a non-empty counter is a Python-level read-modify-write
+# loop, so concurrent updates can lose counts without the lock.
+_recorded_operators: Counter = Counter()
 _recorded_operators_lock = threading.Lock()
 
 # The white list of operator names allowed to be recorded.
@@ -66,11 +69,10 @@ def record_operators_usage(op: LogicalOperator):
     """Record logical operator usage with Ray telemetry."""
     ops_dict = dict()
     _collect_operators_to_dict(op, ops_dict)
-    ops_json_str = ""
     with _recorded_operators_lock:
-        for op, count in ops_dict.items():
-            _recorded_operators.setdefault(op, 0)
-            _recorded_operators[op] += count
+        _recorded_operators.update(ops_dict)
+        # Serialize inside the lock so a concurrent update cannot mutate the
+        # counter mid-iteration.
         ops_json_str = json.dumps(_recorded_operators)
 
     record_extra_usage_tag(TagKey.DATA_LOGICAL_OPS, ops_json_str)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from ray.data._internal.execution.interfaces import PhysicalOperator
 from ray.data._internal.execution.operators.zip_operator import ZipOperator
@@ -31,6 +31,123 @@ from ray.data._internal.planner.plan_read_op import _plan_read_op
 from ray.data._internal.planner.plan_udf_map_op import _plan_udf_map_op
 from ray.data._internal.planner.plan_write_op import _plan_write_op
 
+# A function planning a single logical operator, given the already-planned
+# physical operators for its input dependencies.
+PlanLogicalOpFn = Callable[
+    [LogicalOperator, List[PhysicalOperator]], PhysicalOperator
+]
+
+
+def _plan_read(op: Read, physical_children: List[PhysicalOperator]) -> PhysicalOperator:
+    assert not physical_children
+    return _plan_read_op(op)
+
+
+def _plan_input_data(
+    op: InputData, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert not physical_children
+    return _plan_input_data_op(op)
+
+
+def _plan_write(
+    op: Write, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert len(physical_children) == 1
+    return _plan_write_op(op, physical_children[0])
+
+
+def _plan_from_items(
+    op: FromItems, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert not physical_children
+    return _plan_from_items_op(op)
+
+
+def _plan_from_pandas_refs(
+    op: "FromPandasRefsOperators", physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert not physical_children
+    return _plan_from_pandas_refs_op(op)
+
+
+def _plan_from_numpy_refs(
+    op: FromNumpyRefs, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert not physical_children
+    return _plan_from_numpy_refs_op(op)
+
+
+def _plan_from_arrow_refs(
+    op: FromArrowRefs, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert not physical_children
+    return _plan_from_arrow_refs_op(op)
+
+
+def _plan_udf_map(
+    op: AbstractUDFMap, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert len(physical_children) == 1
+    return _plan_udf_map_op(op, physical_children[0])
+
+
+def _plan_all_to_all(
+    op: AbstractAllToAll, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert len(physical_children) == 1
+    return _plan_all_to_all_op(op, physical_children[0])
+
+
+def _plan_zip(op: Zip, physical_children: List[PhysicalOperator]) -> PhysicalOperator:
+    assert len(physical_children) == 2
+    return ZipOperator(physical_children[0], physical_children[1])
+
+
+def _plan_limit(
+    op: Limit, physical_children: List[PhysicalOperator]
+) -> PhysicalOperator:
+    assert len(physical_children) == 1
+    return _plan_limit_op(op, physical_children[0])
+
+
+# Ordered dispatch over logical operator types. Entries are matched with
+# issubclass(), so abstract families (AbstractUDFMap, AbstractAllToAll) and
+# subclasses of the concrete From* operators resolve to the right planning
+# function.
+# NOTE: use __args__ of FromPandasRefsOperators because subclass checks don't
+# work with subscripted generics. https://stackoverflow.com/a/45959000
+_PLANNING_DISPATCH: List[Tuple[Union[type, Tuple[type, ...]], PlanLogicalOpFn]] = [
+    (Read, _plan_read),
+    (InputData, _plan_input_data),
+    (Write, _plan_write),
+    (FromItems, _plan_from_items),
+    (FromPandasRefsOperators.__args__, _plan_from_pandas_refs),
+    (FromNumpyRefs, _plan_from_numpy_refs),
+    (FromArrowRefs, _plan_from_arrow_refs),
+    (AbstractUDFMap, _plan_udf_map),
+    (AbstractAllToAll, _plan_all_to_all),
+    (Zip, _plan_zip),
+    (Limit, _plan_limit),
+]
+
+# Exact-type index over the dispatch list, so each operator is planned with a
+# single dict lookup instead of walking the isinstance chain per DAG node.
+# Types missing here (e.g. AbstractUDFMap subclasses) are resolved through
+# `_PLANNING_DISPATCH` on first encounter and then cached.
+_PLAN_FN_BY_TYPE: Dict[type, PlanLogicalOpFn] = {
+    op_type: plan_fn
+    for op_types, plan_fn in _PLANNING_DISPATCH
+    for op_type in (op_types if isinstance(op_types, tuple) else (op_types,))
+}
+
+
+def _resolve_plan_fn(op_type: type) -> Optional[PlanLogicalOpFn]:
+    for op_types, plan_fn in _PLANNING_DISPATCH:
+        if issubclass(op_type, op_types):
+            return plan_fn
+    return None
+
 
 class Planner:
     """The planner to convert optimized logical to physical operators.
@@ -41,6 +158,7 @@ class Planner:
 
     def __init__(self):
         self._physical_op_to_logical_op: Dict[PhysicalOperator, LogicalOperator] = {}
+        self._logical_op_to_physical_op: Dict[LogicalOperator, PhysicalOperator] = {}
 
     def plan(self, logical_plan: LogicalPlan) -> PhysicalPlan:
         """Convert logical to physical operators recursively in post-order."""
@@ -48,49 +166,30 @@ class Planner:
         return PhysicalPlan(physical_dag, self._physical_op_to_logical_op)
 
     def _plan(self, logical_op: LogicalOperator) -> PhysicalOperator:
+        # Memoize on operator identity, so that a logical operator reachable
+        # through multiple downstream operators (or planned again by a reused
+        # planner) lowers to a single shared physical operator instead of one
+        # duplicate per path.
+        physical_op = self._logical_op_to_physical_op.get(logical_op)
+        if physical_op is not None:
+            return physical_op
+
         # Plan the input dependencies first.
         physical_children = []
         for child in logical_op.input_dependencies:
             physical_children.append(self._plan(child))
 
-        if isinstance(logical_op, Read):
-            assert not physical_children
-            physical_op = _plan_read_op(logical_op)
-        elif isinstance(logical_op, InputData):
-            assert not physical_children
-            physical_op = _plan_input_data_op(logical_op)
-        elif isinstance(logical_op, Write):
-            assert len(physical_children) == 1
-            physical_op = _plan_write_op(logical_op, physical_children[0])
-        elif isinstance(logical_op, FromItems):
-            assert not physical_children
-            physical_op = _plan_from_items_op(logical_op)
-        # Use __args__ because isinstance() check doesn't work with
-        # subscripted generics. https://stackoverflow.com/a/45959000
-        elif isinstance(logical_op, FromPandasRefsOperators.__args__):
-            assert not physical_children
-            physical_op = _plan_from_pandas_refs_op(logical_op)
-        elif isinstance(logical_op, FromNumpyRefs):
-            assert not physical_children
-            physical_op = _plan_from_numpy_refs_op(logical_op)
-        elif isinstance(logical_op, FromArrowRefs):
-            assert not physical_children
-            physical_op = _plan_from_arrow_refs_op(logical_op)
-        elif isinstance(logical_op, AbstractUDFMap):
-            assert len(physical_children) == 1
-            physical_op = _plan_udf_map_op(logical_op, physical_children[0])
-        elif isinstance(logical_op, AbstractAllToAll):
-            assert len(physical_children) == 1
-            physical_op = _plan_all_to_all_op(logical_op, physical_children[0])
-        elif isinstance(logical_op, Zip):
-            assert len(physical_children) == 2
-            physical_op = ZipOperator(physical_children[0], physical_children[1])
-        elif isinstance(logical_op, Limit):
-            assert len(physical_children) == 1
-            physical_op = _plan_limit_op(logical_op, physical_children[0])
-        else:
-            raise ValueError(
-                f"Found unknown logical operator during planning: {logical_op}"
-            )
+        op_type = type(logical_op)
+        plan_fn = _PLAN_FN_BY_TYPE.get(op_type)
+        if plan_fn is None:
+            plan_fn = _resolve_plan_fn(op_type)
+            if plan_fn is None:
+                raise ValueError(
+                    f"Found unknown logical operator during planning: {logical_op}"
+                )
+            _PLAN_FN_BY_TYPE[op_type] = plan_fn
+        physical_op = plan_fn(logical_op, physical_children)
+
+        self._logical_op_to_physical_op[logical_op] = physical_op
         self._physical_op_to_logical_op[physical_op] = logical_op
         return physical_op
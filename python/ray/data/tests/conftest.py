@@ -373,6 +373,21 @@ def enable_optimizer():
     ctx.optimizer_enabled = original_optimizer
 
 
+@pytest.fixture(scope="module")
+def enable_optimizer_shared(ray_start_regular_shared):
+    """Module-scoped bundle of ``ray_start_regular_shared`` and
+    ``enable_optimizer``: starts the shared Ray cluster and flips the
+    optimizer flags once per test module instead of once per test."""
+    ctx = ray.data.context.DataContext.get_current()
+    original_backend = ctx.new_execution_backend
+    original_optimizer = ctx.optimizer_enabled
+    ctx.new_execution_backend = True
+    ctx.optimizer_enabled = True
+    yield
+    ctx.new_execution_backend = original_backend
+    ctx.optimizer_enabled = original_optimizer
+
+
 @pytest.fixture
 def enable_streaming_executor():
     ctx = ray.data.context.DataContext.get_current()
@@ -0,0 +1,455 @@
+import pytest
+
+import ray
+from ray.data._internal.execution.operators.all_to_all_operator import AllToAllOperator
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.execution.operators.zip_operator import ZipOperator
+from ray.data._internal.logical.interfaces import LogicalPlan
+from ray.data._internal.logical.operators.all_to_all_operator import (
+    Aggregate,
+    RandomShuffle,
+    Repartition,
+    Sort,
+)
+from ray.data._internal.logical.operators.from_items_operator import FromItems
+from ray.data._internal.logical.operators.map_operator import (
+    Filter,
+    FlatMap,
+    MapBatches,
+    MapRows,
+)
+from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.operators.write_operator import Write
+from ray.data._internal.logical.optimizers import PhysicalOptimizer
+from ray.data._internal.planner.planner import Planner
+from ray.data.aggregate import Count
+from ray.data.datasource.parquet_datasource import ParquetDatasource
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+# These planner-only tests never execute a dataset or start a Ray cluster;
+# they exercise `Planner.plan` and `PhysicalOptimizer.optimize` on logical
+# plans built by hand. Keeping them separate from the e2e tests in
+# test_execution_optimizer.py lets pytest-xdist shard them freely.
+
+# Planning is stateless (`Planner.plan` returns a fresh physical plan per
+# call, and the datasource is only read from), so share one instance of each
+# across the module instead of reconstructing them in every test.
+_PLANNER = Planner()
+_OPTIMIZER = PhysicalOptimizer()
+_PARQUET_DS = ParquetDatasource()
+
+
+def _read_op(**read_kwargs) -> Read:
+    # `Read` carries mutable per-op state (e.g. `ray_remote_args`), so each
+    # test gets a fresh op on top of the shared datasource.
+    return Read(_PARQUET_DS, [], **read_kwargs)
+
+
+# Table of simple logical-to-physical conversions, consolidated into one
+# parametrized test below: each case builds a logical op, plans it, and
+# checks the op name plus the physical op and upstream physical op types.
+_LOGICAL_TO_PHYSICAL_CASES = [
+    (lambda: _read_op(), "ReadParquet", MapOperator, InputDataBuffer),
+    (
+        lambda: MapBatches(_read_op(), lambda x: x),
+        "MapBatches(<lambda>)",
+        MapOperator,
+        MapOperator,
+    ),
+    (
+        lambda: MapRows(_read_op(), lambda x: x),
+        "Map(<lambda>)",
+        MapOperator,
+        MapOperator,
+    ),
+    (
+        lambda: Filter(_read_op(), lambda x: x),
+        "Filter(<lambda>)",
+        MapOperator,
+        MapOperator,
+    ),
+    (
+        lambda: FlatMap(_read_op(), lambda x: x),
+        "FlatMap(<lambda>)",
+        MapOperator,
+        MapOperator,
+    ),
+    (
+        lambda: RandomShuffle(_read_op(), seed=0),
+        "RandomShuffle",
+        AllToAllOperator,
+        MapOperator,
+    ),
+    (
+        lambda: Repartition(_read_op(), num_outputs=5, shuffle=True),
+        "Repartition",
+        AllToAllOperator,
+        MapOperator,
+    ),
+    (
+        lambda: Repartition(_read_op(), num_outputs=5, shuffle=False),
+        "Repartition",
+        AllToAllOperator,
+        MapOperator,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "build_op,expected_name,physical_cls,upstream_cls",
+    _LOGICAL_TO_PHYSICAL_CASES,
+    ids=[
+        "read",
+        "map_batches",
+        "map_rows",
+        "filter",
+        "flat_map",
+        "random_shuffle",
+        "repartition_shuffle",
+        "repartition_no_shuffle",
+    ],
+)
+def test_logical_to_physical_operator(
+    enable_optimizer, build_op, expected_name, physical_cls, upstream_cls
+):
+    op = build_op()
+    plan = LogicalPlan(op)
+    physical_op = _PLANNER.plan(plan).dag
+
+    assert op.name == expected_name
+    assert isinstance(physical_op, physical_cls)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], upstream_cls)
+
+
+def test_from_items_operator(enable_optimizer):
+    from_items_op = FromItems(["Hello", "World"])
+    plan = LogicalPlan(from_items_op)
+    physical_op = _PLANNER.plan(plan).dag
+
+    assert from_items_op.name == "FromItems"
+    assert isinstance(physical_op, InputDataBuffer)
+    assert len(physical_op.input_dependencies) == 0
+
+
+def test_map_operator_udf_name(enable_optimizer):
+    # Test the name of the Map operator with different types of UDF.
+    def normal_function(x):
+        return x
+
+    lambda_function = lambda x: x  # noqa: E731
+
+    class CallableClass:
+        def __call__(self, x):
+            return x
+
+    class NormalClass:
+        def method(self, x):
+            return x
+
+    udf_list = [
+        # A nomral function.
+        normal_function,
+        # A lambda function
+        lambda_function,
+        # A callable class.
+        CallableClass,
+        # An instance of a callable class.
+        CallableClass(),
+        # A normal class method.
+        NormalClass().method,
+    ]
+
+    expected_names = [
+        "normal_function",
+        "<lambda>",
+        "CallableClass",
+        "CallableClass",
+        "NormalClass.method",
+    ]
+
+    for udf, expected_name in zip(udf_list, expected_names):
+        op = MapRows(
+            _read_op(),
+            udf,
+        )
+        assert op.name == f"Map({expected_name})"
+
+
+def test_read_map_batches_operator_fusion(enable_optimizer):
+    # Test that Read is fused with MapBatches.
+    read_op = _read_op()
+    op = MapBatches(
+        read_op,
+        lambda x: x,
+    )
+    logical_plan = LogicalPlan(op)
+    physical_plan = _PLANNER.plan(logical_plan)
+    physical_plan = _OPTIMIZER.optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert op.name == "MapBatches(<lambda>)"
+    assert physical_op.name == "ReadParquet->MapBatches(<lambda>)"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], InputDataBuffer)
+
+
+def test_read_map_chain_operator_fusion(enable_optimizer):
+    # Test that a chain of different map operators are fused.
+    read_op = _read_op()
+    op = MapRows(read_op, lambda x: x)
+    op = MapBatches(op, lambda x: x)
+    op = FlatMap(op, lambda x: x)
+    op = Filter(op, lambda x: x)
+    logical_plan = LogicalPlan(op)
+    physical_plan = _PLANNER.plan(logical_plan)
+    physical_plan = _OPTIMIZER.optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert op.name == "Filter(<lambda>)"
+    assert (
+        physical_op.name == "ReadParquet->Map(<lambda>)->MapBatches(<lambda>)"
+        "->FlatMap(<lambda>)->Filter(<lambda>)"
+    )
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], InputDataBuffer)
+
+
+_COMPATIBLE_REMOTE_ARGS_PAIRS = [
+    # Empty remote args are compatible.
+    ({}, {}),
+    # Test `num_cpus` and `num_gpus`.
+    ({"num_cpus": 2}, {"num_cpus": 2}),
+    ({"num_gpus": 2}, {"num_gpus": 2}),
+    # `num_cpus` defaults to 1, `num_gpus` defaults to 0.
+    # The following 2 should be compatible.
+    ({"num_cpus": 1}, {}),
+    ({}, {"num_gpus": 0}),
+    # Test specifying custom resources.
+    ({"resources": {"custom": 1}}, {"resources": {"custom": 1}}),
+    ({"resources": {"custom": 0}}, {"resources": {}}),
+    # If the downstream op doesn't have `scheduling_strategy`, it will
+    # inherit from the upstream op.
+    ({"scheduling_strategy": "SPREAD"}, {}),
+]
+
+_INCOMPATIBLE_REMOTE_ARGS_PAIRS = [
+    # Use different resources.
+    ({"num_cpus": 2}, {"num_gpus": 2}),
+    # Same resource, but different values.
+    ({"num_cpus": 3}, {"num_cpus": 2}),
+    # Incompatible custom resources.
+    ({"resources": {"custom": 2}}, {"resources": {"custom": 1}}),
+    ({"resources": {"custom1": 1}}, {"resources": {"custom2": 1}}),
+    # Different scheduling strategies.
+    ({"scheduling_strategy": "SPREAD"}, {"scheduing_strategy": "PACK"}),
+]
+
+
+def _plan_two_map_batches(up_remote_args, down_remote_args):
+    read_op = Read(
+        _PARQUET_DS,
+        [],
+        # These cases are testing fusing the following 2 map_batches operators.
+        # So we add incompatible remote args to the read op to make sure
+        # it doesn't get fused.
+        ray_remote_args={"resources": {"non-existent": 1}},
+    )
+    op = MapBatches(read_op, lambda x: x, ray_remote_args=up_remote_args)
+    op = MapBatches(op, lambda x: x, ray_remote_args=down_remote_args)
+    logical_plan = LogicalPlan(op)
+    physical_plan = _PLANNER.plan(logical_plan)
+    physical_plan = _OPTIMIZER.optimize(physical_plan)
+    return op, physical_plan.dag
+
+
+@pytest.mark.parametrize(
+    "up_remote_args,down_remote_args", _COMPATIBLE_REMOTE_ARGS_PAIRS
+)
+def test_read_map_batches_operator_fusion_compatible_remote_args(
+    enable_optimizer, up_remote_args, down_remote_args
+):
+    # Test that map operators are stilled fused when remote args are compatible.
+    op, physical_op = _plan_two_map_batches(up_remote_args, down_remote_args)
+
+    assert op.name == "MapBatches(<lambda>)"
+    assert physical_op.name == "MapBatches(<lambda>)->MapBatches(<lambda>)"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert physical_op.input_dependencies[0].name == "ReadParquet"
+
+
+@pytest.mark.parametrize(
+    "up_remote_args,down_remote_args", _INCOMPATIBLE_REMOTE_ARGS_PAIRS
+)
+def test_read_map_batches_operator_fusion_incompatible_remote_args(
+    enable_optimizer, up_remote_args, down_remote_args
+):
+    # Test that map operators won't get fused if the remote args are incompatible.
+    op, physical_op = _plan_two_map_batches(up_remote_args, down_remote_args)
+
+    assert op.name == "MapBatches(<lambda>)"
+    assert physical_op.name == "MapBatches(<lambda>)"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert physical_op.input_dependencies[0].name == "MapBatches(<lambda>)"
+
+
+def test_read_map_batches_operator_fusion_compute_tasks_to_actors(
+    enable_optimizer
+):
+    # Test that a task-based map operator is fused into an actor-based map operator when
+    # the former comes before the latter.
+    read_op = _read_op()
+    op = MapBatches(read_op, lambda x: x)
+    op = MapBatches(op, lambda x: x, compute=ray.data.ActorPoolStrategy())
+    logical_plan = LogicalPlan(op)
+    physical_plan = _PLANNER.plan(logical_plan)
+    physical_plan = _OPTIMIZER.optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert op.name == "MapBatches(<lambda>)"
+    assert physical_op.name == "ReadParquet->MapBatches(<lambda>)->MapBatches(<lambda>)"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], InputDataBuffer)
+
+
+def test_read_map_batches_operator_fusion_compute_read_to_actors(
+    enable_optimizer
+):
+    # Test that reads fuse into an actor-based map operator.
+    read_op = _read_op()
+    op = MapBatches(read_op, lambda x: x, compute=ray.data.ActorPoolStrategy())
+    logical_plan = LogicalPlan(op)
+    physical_plan = _PLANNER.plan(logical_plan)
+    physical_plan = _OPTIMIZER.optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert op.name == "MapBatches(<lambda>)"
+    assert physical_op.name == "ReadParquet->MapBatches(<lambda>)"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], InputDataBuffer)
+
+
+def test_read_map_batches_operator_fusion_incompatible_compute(
+    enable_optimizer
+):
+    # Test that map operators are not fused when compute strategies are incompatible.
+    read_op = _read_op()
+    op = MapBatches(read_op, lambda x: x, compute=ray.data.ActorPoolStrategy())
+    op = MapBatches(op, lambda x: x)
+    logical_plan = LogicalPlan(op)
+    physical_plan = _PLANNER.plan(logical_plan)
+    physical_plan = _OPTIMIZER.optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert op.name == "MapBatches(<lambda>)"
+    assert physical_op.name == "MapBatches(<lambda>)"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    upstream_physical_op = physical_op.input_dependencies[0]
+    assert isinstance(upstream_physical_op, MapOperator)
+    # Reads should fuse into actor compute.
+    assert upstream_physical_op.name == "ReadParquet->MapBatches(<lambda>)"
+
+
+def test_read_map_batches_operator_fusion_target_block_size(
+    enable_optimizer
+):
+    # Test that fusion of map operators merges their block sizes in the expected way
+    # (taking the max).
+    read_op = _read_op()
+    op = MapBatches(read_op, lambda x: x, target_block_size=2)
+    op = MapBatches(op, lambda x: x, target_block_size=5)
+    op = MapBatches(op, lambda x: x, target_block_size=3)
+    logical_plan = LogicalPlan(op)
+    physical_plan = _PLANNER.plan(logical_plan)
+    physical_plan = _OPTIMIZER.optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert op.name == "MapBatches(<lambda>)"
+    # Ops are still fused.
+    assert (
+        physical_op.name == "ReadParquet->MapBatches(<lambda>)->"
+        "MapBatches(<lambda>)->MapBatches(<lambda>)"
+    )
+    assert isinstance(physical_op, MapOperator)
+    # Target block size is set to max.
+    assert physical_op._block_ref_bundler._min_rows_per_bundle == 5
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], InputDataBuffer)
+
+
+def test_write_operator(enable_optimizer):
+    datasource = _PARQUET_DS
+    read_op = Read(datasource, [])
+    op = Write(
+        read_op,
+        datasource,
+    )
+    plan = LogicalPlan(op)
+    physical_op = _PLANNER.plan(plan).dag
+
+    assert op.name == "Write"
+    assert isinstance(physical_op, MapOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+
+
+def test_sort_operator(enable_optimizer):
+    read_op = _read_op()
+    op = Sort(
+        read_op,
+        key="col1",
+        descending=False,
+    )
+    plan = LogicalPlan(op)
+    physical_op = _PLANNER.plan(plan).dag
+
+    assert op.name == "Sort"
+    assert isinstance(physical_op, AllToAllOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+
+
+def test_aggregate_operator(enable_optimizer):
+    read_op = _read_op()
+    op = Aggregate(
+        read_op,
+        key="col1",
+        aggs=[Count()],
+    )
+    plan = LogicalPlan(op)
+    physical_op = _PLANNER.plan(plan).dag
+
+    assert op.name == "Aggregate"
+    assert isinstance(physical_op, AllToAllOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+
+
+def test_zip_operator(enable_optimizer):
+    read_op1 = _read_op()
+    read_op2 = _read_op()
+    op = Zip(read_op1, read_op2)
+    plan = LogicalPlan(op)
+    physical_op = _PLANNER.plan(plan).dag
+
+    assert op.name == "Zip"
+    assert isinstance(physical_op, ZipOperator)
+    assert len(physical_op.input_dependencies) == 2
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+    assert isinstance(physical_op.input_dependencies[1], MapOperator)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -8,7 +8,7 @@ D. Hafner, T. Lillicrap, M. Norouzi, J. Ba
 https://arxiv.org/pdf/2010.02193.pdf
 """
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ray.rllib.core.learner.learner import Learner, LearnerHyperparameters
 from ray.rllib.core.rl_module.rl_module import ModuleID
@@ -44,6 +44,9 @@ class DreamerV3LearnerHyperparameters(LearnerHyperparameters):
     world_model_grad_clip_by_global_norm: float = None
     actor_grad_clip_by_global_norm: float = None
     critic_grad_clip_by_global_norm: float = None
+    # The period (in timesteps) between two updates of the critic's EMA-copy.
+    # None means the EMA-copy is updated on every additional-update call.
+    critic_ema_update_period: Optional[int] = None
 
 
 class DreamerV3Learner(Learner):
@@ -53,6 +56,12 @@ class DreamerV3Learner(Learner):
     for updating the critic EMA-copy after each training step.
     """
 
+    @override(Learner)
+    def build(self) -> None:
+        super().build()
+        # Per-module timestep at which the critic EMA-copy was last updated.
+        self._last_critic_ema_update_timestep: Dict[ModuleID, int] = {}
+
     @override(Learner)
     def additional_update_for_module(
         self,
@@ -68,7 +77,15 @@ class DreamerV3Learner(Learner):
             module_id=module_id, hps=hps, timestep=timestep
         )
 
-        # Update EMA weights of the critic.
-        self.module[module_id].critic.update_ema()
+        # Update EMA weights of the critic, but no more than once every
+        # `critic_ema_update_period` timesteps (None means on every call).
+        last_update = self._last_critic_ema_update_timestep.get(module_id)
+        if (
+            hps.critic_ema_update_period is None
+            or last_update is None
+            or timestep - last_update >= hps.critic_ema_update_period
+        ):
+            self.module[module_id].critic.update_ema()
+            self._last_critic_ema_update_timestep[module_id] = timestep
 
         return results
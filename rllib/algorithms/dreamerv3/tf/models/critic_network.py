@@ -135,6 +135,7 @@ class CriticNetwork(tf.keras.Model):
         for var, var_ema in zip(vars, vars_ema):
             var_ema.assign(var)
 
+    @tf.function
     def update_ema(self) -> None:
         """Updates the EMA-copy of the critic according to the update formula:
 